@@ -2,16 +2,20 @@
 import argparse
 import datetime as dt
 import html as html_mod
+import io
 import json
 import os
 import re
 import subprocess
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 CACHE_DIR_DEFAULT = os.path.expanduser("~/.cache/well-architected")
 CACHE_FILE = "questions.json"
+HTTP_CACHE_DIR = "http"
 REPORTS_DIR_DEFAULT = "reports"
 
 PILLARS = [
@@ -41,6 +45,10 @@ BP_PAGES = {
     "sustainability": ("sus-bp.html", "sus-"),
 }
 
+FETCH_WORKERS = 8
+FETCH_TIMEOUT = (5.0, 20.0)
+FETCH_RETRIES = 3
+
 LICENSE_TEXT = "CC BY-SA 4.0"
 ATTRIBUTION_TEMPLATE = (
     "AWS Well-Architected Framework (c) Amazon.com, Inc. or its affiliates. "
@@ -51,6 +59,20 @@ ATTRIBUTION_TEMPLATE = (
 STATUS_VALUES = {"unanswered", "partial", "answered", "needs_human"}
 CONFIDENCE_VALUES = {"low", "medium", "high", "n/a"}
 
+LANGUAGE_EXTS = {".py", ".js", ".ts", ".go", ".java", ".rb", ".rs"}
+INVENTORY_SKIP_DIRS = {".git", "node_modules", ".venv", "venv", "__pycache__"}
+
+_RE_WS = re.compile(r"\s+")
+_RE_SCRIPT = re.compile(r"<script.*?>.*?</script>", re.DOTALL | re.IGNORECASE)
+_RE_STYLE = re.compile(r"<style.*?>.*?</style>", re.DOTALL | re.IGNORECASE)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_QID_LINE = re.compile(r"^([A-Z]{3,4})\s*(\d+)\s*:\s*(.+)$")
+_RE_QUESTION_PREFIX = re.compile(r"^question\s*\d*:?\s*", re.IGNORECASE)
+_RE_KANBUS_ID = re.compile(r"ID: (kanbus-[\w-]+)")
+_TEXT_BLOCK_TAGS = frozenset(("h1", "h2", "h3", "h4", "p", "li"))
+_TEXT_BLOCKS = ", ".join(sorted(_TEXT_BLOCK_TAGS))
+_RE_HEADER = re.compile(r"^## (?P<id>[^:\n]+): (?P<title>.*)$", re.MULTILINE)
+
 
 class WAIError(Exception):
     pass
@@ -69,6 +91,55 @@ def _write_text(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def _replace_text(path: Path, content: str) -> None:
+    # Write a sibling temp file and rename it over the target so an interrupted run leaves no partial file.
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+# Optional accelerators are imported on first use to keep CLI start-up fast.
+@lru_cache(maxsize=None)
+def _orjson():
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        return None
+    return orjson
+
+
+@lru_cache(maxsize=None)
+def _html_parser():
+    try:
+        from selectolax.lexbor import LexborHTMLParser  # type: ignore
+    except ImportError:
+        return None
+    return LexborHTMLParser
+
+
+def _dump_json(data) -> str:
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def _load_json(raw: str | bytes):
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _today_slug(target_dir: Path) -> str:
     name = target_dir.name or "assessment"
     date = dt.date.today().strftime("%Y%m%d")
@@ -82,59 +153,170 @@ def _run(cmd: List[str]) -> str:
     return proc.stdout
 
 
-def _fetch_url(url: str) -> str:
-    try:
-        import requests  # type: ignore
-    except Exception as exc:
-        raise WAIError("requests is required for wai fetch") from exc
-    resp = requests.get(url, timeout=60)
+_sessions: Dict = {}
+
+
+def _get_session():
+    session = _sessions.get("https")
+    if session is None:
+        try:
+            import requests  # type: ignore
+            from requests.adapters import HTTPAdapter  # type: ignore
+            from urllib3.util.retry import Retry  # type: ignore
+        except Exception as exc:
+            raise WAIError("requests is required for wai fetch") from exc
+        retry = Retry(total=FETCH_RETRIES, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        # Fetch workers may race to build one; setdefault is atomic, so they all share the first.
+        session = _sessions.setdefault("https", session)
+    return session
+
+
+def _fetch_url(
+    url: str,
+    timeout: Tuple[float, float] = FETCH_TIMEOUT,
+    http_cache: Path | None = None,
+    max_age: float | None = None,
+) -> str:
+    if http_cache is None:
+        resp = _get_session().get(url, timeout=timeout)
+        resp.raise_for_status()
+        return resp.text
+
+    import hashlib
+
+    # Conditional GET against an on-disk copy keyed by URL.
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    body_path = http_cache / f"{key}.html"
+    meta_path = http_cache / f"{key}.meta.json"
+    meta: Dict = {}
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = _load_json(_read_text(meta_path))
+        except ValueError:
+            # An unreadable sidecar is a cache miss; the full fetch below rewrites it.
+            meta = {}
+        if meta and max_age is not None and time.time() - meta.get("fetched", 0) <= max_age:
+            return _read_text(body_path)
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    resp = _get_session().get(url, timeout=timeout, headers=headers)
+    if resp.status_code == 304 and meta:
+        meta["fetched"] = time.time()
+        _replace_text(meta_path, _dump_json(meta))
+        return _read_text(body_path)
     resp.raise_for_status()
+    _replace_text(body_path, resp.text)
+    meta = {
+        "url": url,
+        "etag": resp.headers.get("ETag", ""),
+        "last_modified": resp.headers.get("Last-Modified", ""),
+        "fetched": time.time(),
+    }
+    _replace_text(meta_path, _dump_json(meta))
     return resp.text
 
 
+def _fetch_urls(urls: List[str], **kwargs) -> Dict[str, str]:
+    # Fetch concurrently; one failed page does not cancel the others, but the batch still fails
+    # so a partial result never replaces a complete questions cache.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    results: Dict[str, str] = {}
+    failed: List[str] = []
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {executor.submit(_fetch_url, url, **kwargs): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                results[url] = future.result()
+            except WAIError:
+                raise
+            except Exception as exc:
+                print(f"warning: failed to fetch {url}: {exc}", file=sys.stderr)
+                failed.append(url)
+    if failed:
+        raise WAIError("Failed to fetch: " + ", ".join(sorted(failed)))
+    return results
+
+
+@lru_cache(maxsize=4096)
 def _normalize_text(text: str) -> str:
     text = text.replace("\u00a0", " ")
     text = text.replace("Â", " ")
-    return re.sub(r"\s+", " ", text).strip()
+    return _RE_WS.sub(" ", text).strip()
+
+
+def _html_text_lines(html: str) -> List[str]:
+    parser = _html_parser()
+    if parser is not None:
+        tree = parser(html)
+        # Skip nav, TOC and footer chrome by walking only the main content region.
+        root = tree.css_first("main") or tree.css_first("div#main-col-body") or tree.body
+        if root is None:
+            return []
+        nodes = root.css(_TEXT_BLOCKS)
+        # Blocks that contain another block (an li with a nested list) contribute only their own
+        # text, so the nested block's text is not repeated. Each ancestor chain is walked once.
+        containers = set()
+        root_id = root.mem_id
+        for node in nodes:
+            parent = node.parent
+            while parent is not None and parent.mem_id != root_id:
+                if parent.tag in _TEXT_BLOCK_TAGS:
+                    if parent.mem_id in containers:
+                        break
+                    containers.add(parent.mem_id)
+                parent = parent.parent
+        lines = []
+        for node in nodes:
+            line = _normalize_text(node.text(deep=node.mem_id not in containers, separator=" "))
+            if line:
+                lines.append(line)
+        return lines
 
-
-def _parse_questions_from_html(html: str) -> List[Tuple[str, str]]:
     # Extract text from HTML tags naively to avoid heavy deps.
-    text = re.sub(r"<script.*?>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<style.*?>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", "\n", text)
+    text = _RE_SCRIPT.sub("", html)
+    text = _RE_STYLE.sub("", text)
+    text = _RE_TAG.sub("\n", text)
     text = html_mod.unescape(text)
-    text = text.replace("\u00a0", " ").replace("Â", " ")
     lines = [_normalize_text(line) for line in text.splitlines()]
-    lines = [line for line in lines if line]
+    return [line for line in lines if line]
+
+
+def _parse_questions_from_html(html: str) -> List[Tuple[str, str]]:
+    lines = _html_text_lines(html)
 
     questions = []
     for line in lines:
-        m = re.match(r"^([A-Z]{3,4})\s*(\d+)\s*:\s*(.+)$", line)
+        m = _RE_QID_LINE.match(line)
         if m:
             prefix, number, qtext = m.groups()
             qid = f"{prefix}-{number}"
             questions.append((qid, qtext.strip()))
             continue
         if line.lower().startswith("question"):
-            q = re.sub(r"^question\s*\d*:?\s*", "", line, flags=re.IGNORECASE)
+            q = _RE_QUESTION_PREFIX.sub("", line)
             if q.endswith("?") and len(q) > 10:
                 questions.append(("", q))
         elif line.endswith("?") and len(line) > 15:
             questions.append(("", line))
 
-    # Deduplicate while preserving order
-    seen = set()
-    deduped = []
+    # Deduplicate while preserving order; whitespace is ignored so "Foo?" and "Foo ?" collapse.
+    deduped: Dict[str, Tuple[str, str]] = {}
     for qid, qtext in questions:
-        key = (qid or qtext).lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append((qid, qtext))
-    return deduped
+        key = _RE_WS.sub("", qid or qtext).lower()
+        deduped.setdefault(key, (qid, qtext))
+    return list(deduped.values())
 
 
+@lru_cache(maxsize=4096)
 def _short_title(question: str) -> str:
     title = question.strip()
     if len(title) > 80:
@@ -151,12 +333,12 @@ def load_cache(cache_dir: Path) -> Dict:
     path = cache_dir / CACHE_FILE
     if not path.exists():
         raise WAIError("Questions cache not found. Run wai fetch first.")
-    return json.loads(_read_text(path))
+    return _load_json(_read_text(path))
 
 
 def save_cache(cache_dir: Path, data: Dict) -> None:
     _ensure_dir(cache_dir)
-    _write_text(cache_dir / CACHE_FILE, json.dumps(data, indent=2))
+    _write_text(cache_dir / CACHE_FILE, _dump_json(data))
 
 
 def cmd_fetch(args: argparse.Namespace) -> None:
@@ -167,41 +349,60 @@ def cmd_fetch(args: argparse.Namespace) -> None:
             print(f"Cache exists at {cache_dir / CACHE_FILE}. Use --refresh to re-fetch.")
             return
 
+    http_cache = cache_dir / HTTP_CACHE_DIR
+    max_age = args.max_age
+
     questions = []
     fetched_at = dt.datetime.now(dt.timezone.utc).isoformat()
-    for pillar, (bp_page, href_prefix) in BP_PAGES.items():
-        bp_url = f"{AWS_WA_BASE}/{bp_page}"
-        bp_html = _fetch_url(bp_url)
-        hrefs = re.findall(rf'href="./({re.escape(href_prefix)}[^"]+\.html)"', bp_html)
-        topic_pages = sorted(set(hrefs))
-        if not topic_pages:
-            continue
+    bp_urls = {pillar: f"{AWS_WA_BASE}/{bp_page}" for pillar, (bp_page, _) in BP_PAGES.items()}
+    bp_html = _fetch_urls(list(bp_urls.values()), http_cache=http_cache, max_age=max_age)
 
-        idx = 0
-        for page in topic_pages:
-            page_url = f"{AWS_WA_BASE}/{page}"
-            page_html = _fetch_url(page_url)
-            parsed = _parse_questions_from_html(page_html)
-            for qid, qtext in parsed:
-                idx += 1
-                questions.append(
-                    {
-                        "pillar": pillar,
-                        "question_id": qid or _qid(pillar, idx),
-                        "question_text": qtext,
-                        "source_url": page_url,
-                        "fetched_at": fetched_at,
-                        "license": LICENSE_TEXT,
-                    }
-                )
+    pages = []
+    for pillar, (_, href_prefix) in BP_PAGES.items():
+        html = bp_html.get(bp_urls[pillar])
+        if html is None:
+            continue
+        hrefs = re.findall(rf'href="./({re.escape(href_prefix)}[^"]+\.html)"', html)
+        for page in sorted(set(hrefs)):
+            pages.append((pillar, f"{AWS_WA_BASE}/{page}"))
+
+    page_html = _fetch_urls([page_url for _, page_url in pages], http_cache=http_cache, max_age=max_age)
+    idx_by_pillar: Dict[str, int] = {}
+    for pillar, page_url in pages:
+        html = page_html.get(page_url)
+        if html is None:
+            continue
+        for qid, qtext in _parse_questions_from_html(html):
+            idx = idx_by_pillar.get(pillar, 0) + 1
+            idx_by_pillar[pillar] = idx
+            questions.append(
+                {
+                    "pillar": pillar,
+                    "question_id": qid or _qid(pillar, idx),
+                    "question_text": qtext,
+                    "source_url": page_url,
+                    "fetched_at": fetched_at,
+                    "license": LICENSE_TEXT,
+                }
+            )
 
     if not questions:
         raise WAIError("No questions parsed. Check parser heuristics.")
 
     save_cache(cache_dir, {"questions": questions, "fetched_at": fetched_at})
+    # Page text is not reused after a fetch; release it.
+    _normalize_text.cache_clear()
+    _short_title.cache_clear()
     print(f"Wrote {len(questions)} questions to {cache_dir / CACHE_FILE}")
 
 
+def _questions_by_pillar(questions: List[Dict]) -> Dict[str, List[Dict]]:
+    by_pillar: Dict[str, List[Dict]] = {pillar: [] for pillar in PILLARS}
+    for q in questions:
+        by_pillar.setdefault(q["pillar"], []).append(q)
+    return by_pillar
+
+
 def _report_paths(reports_dir: Path, assessment: str) -> Tuple[Path, Path]:
     base = reports_dir / assessment
     return base, base / "index.md"
@@ -211,6 +412,7 @@ def _pillar_report_path(base: Path, pillar: str) -> Path:
     return base / f"{pillar}.md"
 
 
+@lru_cache(maxsize=None)
 def _attribution_block(url: str) -> str:
     return ATTRIBUTION_TEMPLATE.format(source_url=url)
 
@@ -226,8 +428,7 @@ def _pillar_footer(url: str) -> str:
     return f"\n> Attribution: {_attribution_block(url)}\n"
 
 
-def _question_block(q: Dict) -> str:
-    now = dt.datetime.now(dt.timezone.utc).isoformat()
+def _question_block(q: Dict, now: str) -> str:
     question_text = _normalize_text(q["question_text"])
     title = _short_title(question_text)
     return (
@@ -258,16 +459,16 @@ def _write_reports(cache: Dict, reports_dir: Path, assessment: str) -> None:
     _write_text(index_path, "\n".join(index_lines) + "\n")
 
     # Pillars
-    questions = cache.get("questions", [])
+    now = dt.datetime.now(dt.timezone.utc).isoformat()
+    by_pillar = _questions_by_pillar(cache.get("questions", []))
     for pillar in PILLARS:
         url = PILLAR_URLS[pillar]
-        header = _pillar_header(pillar, url)
-        blocks = [header]
-        for q in questions:
-            if q["pillar"] == pillar:
-                blocks.append(_question_block(q))
-        blocks.append(_pillar_footer(url))
-        _write_text(_pillar_report_path(base, pillar), "".join(blocks))
+        buf = io.StringIO()
+        buf.write(_pillar_header(pillar, url))
+        for q in by_pillar[pillar]:
+            buf.write(_question_block(q, now))
+        buf.write(_pillar_footer(url))
+        _write_text(_pillar_report_path(base, pillar), buf.getvalue())
 
 
 def _create_kanbus_issue(title: str, issue_type: str, parent: str = "") -> str:
@@ -275,29 +476,52 @@ def _create_kanbus_issue(title: str, issue_type: str, parent: str = "") -> str:
     if parent:
         cmd += ["--parent", parent]
     out = _run(cmd)
-    match = re.search(r"ID: (kanbus-[\w-]+)", out)
+    match = _RE_KANBUS_ID.search(out)
     if not match:
         raise WAIError("Failed to parse Kanbus ID")
     short_id = match.group(1)
     return _resolve_full_id(short_id, title=title, parent=parent)
 
 
+
 def _is_full_id(issue_id: str) -> bool:
     return issue_id.count("-") >= 5
 
 
+def _index_issues(issues: List[Dict]) -> Tuple[List[str], List[Dict]]:
+    # Issues sorted by id, so all ids sharing a prefix form one contiguous run.
+    ordered = sorted(issues, key=lambda i: i.get("id", ""))
+    return [i.get("id", "") for i in ordered], ordered
+
+
+def _issues_with_prefix(index: Tuple[List[str], List[Dict]], prefix: str) -> List[Dict]:
+    import bisect
+
+    ids, ordered = index
+    start = bisect.bisect_left(ids, prefix)
+    end = start
+    while end < len(ids) and ids[end].startswith(prefix):
+        end += 1
+    return ordered[start:end]
+
+
 def _resolve_full_id(
-    short_id: str, title: str = "", parent: str = "", issues: List[Dict] | None = None
+    short_id: str,
+    title: str = "",
+    parent: str = "",
+    index: Tuple[List[str], List[Dict]] | None = None,
 ) -> str:
     if _is_full_id(short_id):
         return short_id
-    if issues is None:
+    if index is not None:
+        candidates = _issues_with_prefix(index, short_id)
+    else:
+        # A one-off lookup scans linearly; sorting the snapshot only pays off when the index is reused.
         try:
-            snapshot = json.loads(_run(["kanbus", "console", "snapshot"]))
-            issues = snapshot.get("issues", [])
+            snapshot = _load_json(_run(["kanbus", "console", "snapshot"]))
         except Exception:
             return short_id
-    candidates = [i for i in issues if i.get("id", "").startswith(short_id)]
+        candidates = [i for i in snapshot.get("issues", []) if i.get("id", "").startswith(short_id)]
     if title:
         candidates = [i for i in candidates if i.get("title") == title]
     if parent:
@@ -339,67 +563,102 @@ def cmd_init(args: argparse.Namespace) -> None:
     initiative_id = _create_kanbus_issue(f"Well-Architected Assessment: {assessment}", "initiative")
     kanbus_map = {"initiative": initiative_id, "epics": {}, "tasks": {}}
 
-    # Create epics and tasks
-    questions = cache.get("questions", [])
+    # Create epics and tasks one at a time; kanbus writes to a file-backed store.
+    by_pillar = _questions_by_pillar(cache.get("questions", []))
     for pillar in PILLARS:
         epic_id = _create_kanbus_issue(f"{pillar.replace('-', ' ').title()} Pillar", "epic", initiative_id)
         kanbus_map["epics"][pillar] = epic_id
-        idx = 0
-        for q in questions:
-            if q["pillar"] != pillar:
-                continue
-            idx += 1
+        for q in by_pillar[pillar]:
             title = f"{q['question_id']} { _short_title(q['question_text']) }"
             task_id = _create_kanbus_issue(title, "task", epic_id)
             kanbus_map["tasks"][q["question_id"]] = task_id
 
     base, _ = _report_paths(reports_dir, assessment)
-    _write_text(base / "kanbus-map.json", json.dumps(kanbus_map, indent=2))
+    _write_text(base / "kanbus-map.json", _dump_json(kanbus_map))
 
     # Inject Kanbus IDs into reports
     _apply_kanbus_ids(base, kanbus_map)
 
 
 def _parse_questions_from_report(content: str) -> List[Dict]:
-    pattern = re.compile(r"^## (?P<id>[^:]+): (?P<title>.*)$", re.MULTILINE)
     entries = []
-    for match in pattern.finditer(content):
+    for match in _RE_HEADER.finditer(content):
         start = match.start()
         end = content.find("\n## ", match.end())
         if end == -1:
             end = len(content)
         block = content[start:end]
         entry = _parse_question_block(block)
+        entry["start"] = start
+        entry["end"] = end
         entries.append(entry)
     return entries
 
 
-def _parse_field(block: str, field: str) -> str:
-    m = re.search(rf"^{re.escape(field)}:[ \t]*(.*)$", block, re.MULTILINE)
-    if not m:
-        return ""
-    return m.group(1).strip()
-
-
-def _replace_field(block: str, field: str, value: str) -> str:
-    pattern = re.compile(rf"^{re.escape(field)}:.*$", re.MULTILINE)
-    repl = f"{field}: {value}"
-    if pattern.search(block):
-        return pattern.sub(repl, block)
-    return block
+def _scan_report_statuses(content: str) -> List[Tuple[str, str, str]]:
+    # Line scanner yielding (id, status, confidence) for callers that need nothing else.
+    # Block boundaries match _parse_questions_from_report: any "## " line ends a block.
+    records = []
+    current = None
+    for line in content.splitlines():
+        if line.startswith("## "):
+            colon = line.find(":")
+            if colon > 3 and line.startswith(" ", colon + 1):
+                current = [line[3:colon].strip(), None, None]
+                records.append(current)
+            else:
+                current = None
+        elif current is not None:
+            if current[1] is None and line.startswith("Status:"):
+                current[1] = line[7:].strip()
+            elif current[2] is None and line.startswith("Confidence:"):
+                current[2] = line[11:].strip()
+    return [(qid, status or "", confidence or "") for qid, status, confidence in records]
+
+
+def _splice_blocks(content: str, replacements: List[Tuple[Dict, str]]) -> str:
+    # Rebuild the report in one pass; replacements must follow document order.
+    out = []
+    cursor = 0
+    for entry, block_new in replacements:
+        out.append(content[cursor : entry["start"]])
+        out.append(block_new)
+        cursor = entry["end"]
+    out.append(content[cursor:])
+    return "".join(out)
+
+
+def _rewrite_block(block: str, fields: Dict[str, str], header: str | None = None) -> str:
+    # One pass over the block's lines; every line for a given field is rewritten.
+    lines = block.split("\n")
+    if header is not None:
+        lines[0] = header
+    for i in range(1, len(lines)):
+        name, sep, _ = lines[i].partition(":")
+        if sep and name in fields:
+            lines[i] = f"{name}: {fields[name]}"
+    return "\n".join(lines)
 
 
 def _parse_question_block(block: str) -> Dict:
     lines = block.splitlines()
     header = lines[0]
     qid, title = header[3:].split(": ", 1)
+    # Single scan; the first line for a field wins.
+    fields: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep and name not in fields:
+            fields[name] = value.strip()
     return {
         "id": qid.strip(),
         "title": title.strip(),
-        "question": _parse_field(block, "Question"),
-        "status": _parse_field(block, "Status"),
-        "confidence": _parse_field(block, "Confidence"),
-        "kanbus": _parse_field(block, "Kanbus Task"),
+        "question": fields.get("Question", ""),
+        "status": fields.get("Status", ""),
+        "confidence": fields.get("Confidence", ""),
+        "answer": fields.get("Answer", ""),
+        "human_questions": fields.get("Human Questions", ""),
+        "kanbus": fields.get("Kanbus Task", ""),
         "block": block,
     }
 
@@ -410,15 +669,14 @@ def _apply_kanbus_ids(base: Path, kanbus_map: Dict) -> None:
         if not path.exists():
             continue
         content = _read_text(path)
-        new_content = content
         entries = _parse_questions_from_report(content)
+        replacements = []
         for entry in entries:
             qid = entry["id"]
             task_id = kanbus_map["tasks"].get(qid, "")
             if task_id:
-                block = entry["block"]
-                block_new = _replace_field(block, "Kanbus Task", task_id)
-                new_content = new_content.replace(block, block_new)
+                replacements.append((entry, _rewrite_block(entry["block"], {"Kanbus Task": task_id})))
+        new_content = _splice_blocks(content, replacements)
         if new_content != content:
             _write_text(path, new_content)
 
@@ -436,8 +694,9 @@ def cmd_scan(args: argparse.Namespace) -> None:
     evidence = {"inventory": {}, "scanners": {}}
 
     # Simple inventory
-    evidence["inventory"]["languages"] = _detect_languages(target_dir)
-    evidence["inventory"]["infra"] = _detect_infra(target_dir)
+    languages, infra = _detect_inventory(target_dir)
+    evidence["inventory"]["languages"] = languages
+    evidence["inventory"]["infra"] = infra
     evidence["inventory"]["ci"] = _detect_ci(target_dir)
 
     # Optional scanners
@@ -448,32 +707,44 @@ def cmd_scan(args: argparse.Namespace) -> None:
         result = _run_optional_scanner(scanner, target_dir)
         evidence["scanners"][scanner] = result
 
-    _write_text(base / "evidence.json", json.dumps(evidence, indent=2))
+    _write_text(base / "evidence.json", _dump_json(evidence))
     print(f"Wrote evidence to {base / 'evidence.json'}")
 
 
-def _detect_languages(target_dir: Path) -> List[str]:
-    langs = set()
-    for path in target_dir.rglob("*"):
-        if path.is_dir():
+def _iter_files(target_dir: Path):
+    # Yields (parent dir name, file name); dirent types avoid a stat per entry.
+    stack = [(str(target_dir), "")]
+    while stack:
+        root, parent = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in INVENTORY_SKIP_DIRS:
+                            stack.append((entry.path, entry.name))
+                    else:
+                        yield parent, entry.name
+        except OSError:
             continue
-        ext = path.suffix.lower()
-        if ext in {".py", ".js", ".ts", ".go", ".java", ".rb", ".rs"}:
-            langs.add(ext)
-    return sorted(langs)
 
 
-def _detect_infra(target_dir: Path) -> List[str]:
-    infra = []
-    if list(target_dir.rglob("*.tf")):
-        infra.append("terraform")
-    if list(target_dir.rglob("template.yaml")) or list(target_dir.rglob("template.yml")):
-        infra.append("sam")
-    if list(target_dir.rglob("serverless.yml")):
-        infra.append("serverless")
-    if list(target_dir.rglob("helm/*.yaml")):
-        infra.append("helm")
-    return sorted(set(infra))
+def _detect_inventory(target_dir: Path) -> Tuple[List[str], List[str]]:
+    # One walk collects both language and infra signals; vendored and VCS dirs are pruned.
+    langs = set()
+    infra = set()
+    for parent, name in _iter_files(target_dir):
+        ext = os.path.splitext(name)[1].lower()
+        if ext in LANGUAGE_EXTS:
+            langs.add(ext)
+        if name.endswith(".tf"):
+            infra.add("terraform")
+        elif name in {"template.yaml", "template.yml"}:
+            infra.add("sam")
+        elif name == "serverless.yml":
+            infra.add("serverless")
+        if parent == "helm" and name.endswith(".yaml"):
+            infra.add("helm")
+    return sorted(langs), sorted(infra)
 
 
 def _detect_ci(target_dir: Path) -> List[str]:
@@ -493,16 +764,29 @@ def _run_optional_scanner(scanner: str, target_dir: Path) -> Dict:
     if scanner == "semgrep":
         if not shutil.which("semgrep"):
             return {"status": "missing"}
-        out = _run(["semgrep", "--json", "--config", "auto", str(target_dir)])
-        return {"status": "ok", "output": json.loads(out)}
+        output = _run_json_scanner(["semgrep", "--json", "--config", "auto", str(target_dir)])
+        return {"status": "ok", "output": output}
     if scanner == "trivy":
         if not shutil.which("trivy"):
             return {"status": "missing"}
-        out = _run(["trivy", "fs", "--format", "json", str(target_dir)])
-        return {"status": "ok", "output": json.loads(out)}
+        output = _run_json_scanner(["trivy", "fs", "--format", "json", str(target_dir)])
+        return {"status": "ok", "output": output}
     return {"status": "unknown_scanner"}
 
 
+def _run_json_scanner(cmd: List[str]) -> Dict:
+    # Scanners write JSON to a temp file so large reports are not buffered through stdout.
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        _run(cmd + ["--output", tmp])
+        return _load_json(Path(tmp).read_bytes())
+    finally:
+        os.unlink(tmp)
+
+
 def cmd_apply_evidence(args: argparse.Namespace) -> None:
     reports_dir = Path(args.reports_dir or REPORTS_DIR_DEFAULT)
     base, _ = _report_paths(reports_dir, args.assessment)
@@ -510,7 +794,7 @@ def cmd_apply_evidence(args: argparse.Namespace) -> None:
     if not evidence_path.exists():
         raise WAIError("evidence.json not found. Run wai scan first.")
 
-    evidence = json.loads(_read_text(evidence_path))
+    evidence = _load_json(_read_text(evidence_path))
     inventory = evidence.get("inventory", {})
     summary_bits = []
     if inventory.get("languages"):
@@ -527,46 +811,25 @@ def cmd_apply_evidence(args: argparse.Namespace) -> None:
             continue
         content = _read_text(path)
         entries = _parse_questions_from_report(content)
-        new_content = content
+        replacements = []
         for entry in entries:
-            block = entry["block"]
             question_text = _normalize_text(entry.get("question") or entry.get("title") or "")
-            current_status = entry.get("status") or "unanswered"
-            answer_text = _parse_field(block, "Answer")
-            if answer_text:
-                current_status = "answered"
-            elif current_status == "answered":
-                current_status = "partial" if summary else "needs_human"
-            ev_value = summary if summary else ""
-            block_new = _replace_field(block, "Evidence", ev_value)
-            if current_status == "answered":
-                block_new = _replace_field(block_new, "Status", "answered")
-            if current_status != "answered":
-                if summary:
-                    block_new = _replace_field(block_new, "Status", "partial")
-                else:
-                    block_new = _replace_field(block_new, "Status", "needs_human")
-            if question_text and current_status != "answered":
-                existing_hq = _parse_field(block_new, "Human Questions")
+            answered = bool(entry["answer"])
+            fields = {"Evidence": summary}
+            if answered:
+                fields["Status"] = "answered"
+            else:
+                fields["Status"] = "partial" if summary else "needs_human"
+            if question_text and not answered:
+                existing_hq = entry["human_questions"]
                 if not existing_hq or existing_hq.startswith("Please describe how your team addresses:"):
-                    block_new = _replace_field(
-                        block_new,
-                        "Human Questions",
-                        f"Please describe how your team addresses: {question_text}",
-                    )
+                    fields["Human Questions"] = f"Please describe how your team addresses: {question_text}"
+            header = None
             if question_text:
-                block_new = _replace_field(block_new, "Question", question_text)
-                title = _short_title(question_text)
-                block_new = re.sub(
-                    r"^##\s+[^:]+:.*$",
-                    f"## {entry['id']}: {title}",
-                    block_new,
-                    flags=re.MULTILINE,
-                )
-            block_new = re.sub(r"^##\s+([^:]+):\s+", r"## \1: ", block_new, flags=re.MULTILINE)
-            block_new = block_new.replace("\u00a0", " ").replace("Â", " ")
-            new_content = new_content.replace(block, block_new)
-        new_content = re.sub(r"^##\s+([^:]+):\s+", r"## \1: ", new_content, flags=re.MULTILINE)
+                fields["Question"] = question_text
+                header = f"## {entry['id']}: {_short_title(question_text)}"
+            replacements.append((entry, _rewrite_block(entry["block"], fields, header)))
+        new_content = _splice_blocks(content, replacements)
         new_content = new_content.replace("\u00a0", " ").replace("Â", " ")
         _write_text(path, new_content)
 
@@ -579,19 +842,17 @@ def cmd_list_unanswered(args: argparse.Namespace) -> None:
         path = _pillar_report_path(base, pillar)
         if not path.exists():
             continue
-        content = _read_text(path)
-        entries = _parse_questions_from_report(content)
-        for entry in entries:
-            if entry["status"] in {"", "unanswered", "needs_human", "partial"}:
-                output.append({"pillar": pillar, "question_id": entry["id"], "status": entry["status"]})
-    print(json.dumps(output, indent=2))
+        for qid, status, _ in _scan_report_statuses(_read_text(path)):
+            if status in {"", "unanswered", "needs_human", "partial"}:
+                output.append({"pillar": pillar, "question_id": qid, "status": status})
+    print(_dump_json(output))
 
 
 def cmd_record_answer(args: argparse.Namespace) -> None:
     reports_dir = Path(args.reports_dir or REPORTS_DIR_DEFAULT)
     base, _ = _report_paths(reports_dir, args.assessment)
     raw_answer = _read_text(Path(args.answer_file))
-    answer_text = re.sub(r"\s+", " ", raw_answer).strip()
+    answer_text = _RE_WS.sub(" ", raw_answer).strip()
     updated = False
 
     for pillar in PILLARS:
@@ -600,18 +861,20 @@ def cmd_record_answer(args: argparse.Namespace) -> None:
             continue
         content = _read_text(path)
         entries = _parse_questions_from_report(content)
-        new_content = content
+        replacements = []
         for entry in entries:
             if entry["id"] != args.question_id:
                 continue
-            block = entry["block"]
-            block_new = _replace_field(block, "Status", args.status)
-            block_new = _replace_field(block_new, "Confidence", args.confidence)
-            block_new = re.sub(r"^Answer:.*$", f"Answer: {answer_text}", block_new, flags=re.MULTILINE)
             now = dt.datetime.now(dt.timezone.utc).isoformat()
-            block_new = _replace_field(block_new, "Last Updated", now)
-            new_content = new_content.replace(block, block_new)
+            fields = {
+                "Status": args.status,
+                "Confidence": args.confidence,
+                "Answer": answer_text,
+                "Last Updated": now,
+            }
+            replacements.append((entry, _rewrite_block(entry["block"], fields)))
             updated = True
+        new_content = _splice_blocks(content, replacements)
         if new_content != content:
             _write_text(path, new_content)
 
@@ -619,53 +882,51 @@ def cmd_record_answer(args: argparse.Namespace) -> None:
         raise WAIError("Question ID not found in reports")
 
 
+def _sync_kanbus_task(task_id: str, status: str, answer: str) -> None:
+    if answer:
+        _kanbus_comment(task_id, f"Answer:\n{answer}")
+    if status == "answered":
+        _kanbus_update_status(task_id, "closed")
+    elif status == "needs_human":
+        _kanbus_update_status(task_id, "blocked")
+
+
 def cmd_sync_kanbus(args: argparse.Namespace) -> None:
     reports_dir = Path(args.reports_dir or REPORTS_DIR_DEFAULT)
     base, _ = _report_paths(reports_dir, args.assessment)
-    kanbus_map = json.loads(_read_text(base / "kanbus-map.json"))
+    kanbus_map = _load_json(_read_text(base / "kanbus-map.json"))
     try:
-        snapshot = json.loads(_run(["kanbus", "console", "snapshot"]))
+        snapshot = _load_json(_run(["kanbus", "console", "snapshot"]))
         issues = snapshot.get("issues", [])
     except Exception:
         issues = []
+    index = _index_issues(issues)
 
+    # Parse each report once; kanbus calls run one at a time against its file-backed store.
+    entries_by_pillar = {}
     for pillar in PILLARS:
         path = _pillar_report_path(base, pillar)
         if not path.exists():
             continue
         content = _read_text(path)
         entries = _parse_questions_from_report(content)
+        entries_by_pillar[pillar] = entries
         for entry in entries:
             qid = entry["id"]
             task_id = kanbus_map["tasks"].get(qid)
             if not task_id:
                 continue
-            task_id = _resolve_full_id(task_id, issues=issues)
-            status = entry["status"]
-            answer = _parse_field(entry["block"], "Answer")
-            if answer:
-                _kanbus_comment(task_id, f"Answer:\n{answer}")
-            if status == "answered":
-                _kanbus_update_status(task_id, "closed")
-            elif status == "needs_human":
-                _kanbus_update_status(task_id, "blocked")
+            task_id = _resolve_full_id(task_id, index=index)
+            _sync_kanbus_task(task_id, entry["status"], entry["answer"])
 
     # Close epics if all tasks closed
     for pillar, epic_id in kanbus_map.get("epics", {}).items():
-        epic_id = _resolve_full_id(epic_id, issues=issues)
-        # naive: if every task is closed in report, close epic
-        all_closed = True
-        path = _pillar_report_path(base, pillar)
-        if not path.exists():
+        entries = entries_by_pillar.get(pillar)
+        if entries is None:
             continue
-        content = _read_text(path)
-        entries = _parse_questions_from_report(content)
-        for entry in entries:
-            if entry["status"] != "answered":
-                all_closed = False
-                break
-        if all_closed:
-            _kanbus_update_status(epic_id, "closed")
+        # naive: if every task is closed in report, close epic
+        if all(entry["status"] == "answered" for entry in entries):
+            _kanbus_update_status(_resolve_full_id(epic_id, index=index), "closed")
 
 
 def cmd_validate(args: argparse.Namespace) -> None:
@@ -677,17 +938,15 @@ def cmd_validate(args: argparse.Namespace) -> None:
         if not path.exists():
             errors.append(f"missing pillar report: {pillar}")
             continue
-        content = _read_text(path)
-        entries = _parse_questions_from_report(content)
         ids = set()
-        for entry in entries:
-            if entry["id"] in ids:
-                errors.append(f"duplicate question id {entry['id']} in {pillar}")
-            ids.add(entry["id"])
-            if entry["status"] and entry["status"] not in STATUS_VALUES:
-                errors.append(f"invalid status {entry['status']} in {entry['id']}")
-            if entry["confidence"] and entry["confidence"] not in CONFIDENCE_VALUES:
-                errors.append(f"invalid confidence {entry['confidence']} in {entry['id']}")
+        for qid, status, confidence in _scan_report_statuses(_read_text(path)):
+            if qid in ids:
+                errors.append(f"duplicate question id {qid} in {pillar}")
+            ids.add(qid)
+            if status and status not in STATUS_VALUES:
+                errors.append(f"invalid status {status} in {qid}")
+            if confidence and confidence not in CONFIDENCE_VALUES:
+                errors.append(f"invalid confidence {confidence} in {qid}")
     if errors:
         for err in errors:
             print(err)
@@ -702,6 +961,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_fetch = sub.add_parser("fetch")
     p_fetch.add_argument("--refresh", action="store_true")
     p_fetch.add_argument("--cache-dir")
+    p_fetch.add_argument("--max-age", type=float, help="reuse cached pages younger than this many seconds")
 
     p_init = sub.add_parser("init")
     p_init.add_argument("--target-dir", required=True)
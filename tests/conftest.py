@@ -1,4 +1,5 @@
 import importlib.util
+import shutil
 from pathlib import Path
 
 import pytest
@@ -19,5 +20,8 @@ def wai():
 
 
 @pytest.fixture()
-def ctx(tmp_path):
-    return {"tmp_path": tmp_path}
+def ctx(tmp_path_factory):
+    # Scenario dirs are removed on teardown rather than kept for pytest's retention window.
+    tmp_path = tmp_path_factory.mktemp("scn")
+    yield {"tmp_path": tmp_path}
+    shutil.rmtree(tmp_path, ignore_errors=True)
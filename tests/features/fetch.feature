@@ -4,3 +4,34 @@ Feature: Fetch Well-Architected questions
     Given sample AWS pages
     When I run wai fetch
     Then the questions cache is created with entries for all pillars
+
+  Scenario: Fetch reads nested list items and line breaks as separate text
+    Given sample AWS pages with nested markup
+    When I run wai fetch
+    Then each page question is cached once without fused words
+
+  Scenario: Refetch revalidates cached pages with their ETags
+    Given AWS pages served with ETags
+    When I run wai fetch
+    And I run wai fetch
+    Then the refetch sent If-None-Match and reused the cached pages
+
+  Scenario: Refetch within the max age skips the network
+    Given AWS pages served with ETags
+    When I run wai fetch
+    And I run wai fetch with a max age of one hour
+    Then no page was requested twice
+
+  Scenario: A truncated page cache entry is treated as a miss
+    Given AWS pages served with ETags
+    When I run wai fetch
+    And a cached page's metadata is truncated
+    And I run wai fetch
+    Then the refetch downloaded every page again
+
+  Scenario: A failed page leaves the existing cache untouched
+    Given sample AWS pages
+    When I run wai fetch
+    And the security best-practice page fails to download
+    And I run wai fetch and it fails
+    Then the error names the failed page and the cache keeps all pillars
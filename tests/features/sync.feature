@@ -3,5 +3,6 @@ Feature: Sync answers to Kanbus
   Scenario: Post answers and update task status
     Given an initialized assessment
     And an answered question
+    And a Kanbus snapshot listing the assessment's issues by full ID
     When I run wai sync-kanbus
     Then Kanbus tasks are commented and closed accordingly
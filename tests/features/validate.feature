@@ -0,0 +1,14 @@
+Feature: Validate reports and list open questions
+
+  Scenario: Validate flags duplicate IDs and invalid statuses
+    Given an initialized assessment
+    And a pillar report with a duplicate question, an invalid status and a heading without a colon
+    When I run wai validate
+    Then validate reports only the duplicate ID and the invalid status
+    And the status scanner agrees with the report parser
+
+  Scenario: List unanswered questions past malformed sections
+    Given an initialized assessment
+    And a pillar report with a duplicate question, an invalid status and a heading without a colon
+    When I run wai list-unanswered
+    Then each pillar lists its one unanswered question